@@ -6,7 +6,12 @@ import os
 import sys
 sys.path.insert(0, os.path.abspath('..'))
 
-import pe
+# Prefer the version stashed in the environment by the Makefile; fall
+# back to reading it from its own module rather than importing the whole
+# package. Under parallel builds this code runs once per worker.
+pe_version = os.environ.get('PE_VERSION')
+if not pe_version:
+    from pe._version import __version__ as pe_version
 
 
 # -- Project information -----------------------------------------------------
@@ -14,25 +19,45 @@ import pe
 project = 'PyHam PE'
 copyright = '2024, Martin F N Cooper. All rights reserved'
 author = 'Martin F N Cooper'
-release = pe.__version__
+release = pe_version
 version = release
 
 
 # -- General configuration ---------------------------------------------------
 
 extensions = [
-    'autoapi.extension'
+    'sphinx_remove_toctrees'
 ]
+# API generation is skipped when building with '-t noapi' (see the
+# html-fast target in the Makefile), for quick prose-only iteration.
+if not tags.has('noapi'):  # noqa: F821 (injected by Sphinx)
+    extensions.insert(0, 'autoapi.extension')
+# The RTD theme renders the global toctree into every page, so the many
+# AutoAPI stub pages make HTML writing quadratic in page count. Dropping
+# them from the toctree keeps the write phase linear.
+remove_from_toctrees = ['autoapi/pe/*']
 autoapi_dirs = ['../pe']
+autoapi_file_patterns = ['*.py']
+# The version module is documented as part of the package docstring; no
+# need for AutoAPI to parse (or page) it.
+autoapi_ignore = ['*/_version.py']
+autoapi_root = 'autoapi'
+# Keep the generated stubs on disk so that subsequent builds can skip
+# regeneration entirely (REBUILD_AUTOAPI=0) and rely on Sphinx's normal
+# up-to-date check instead of a full reparse of the package.
+autoapi_keep_files = True
+autoapi_generate_api_docs = os.environ.get('REBUILD_AUTOAPI', '1') == '1'
 autoapi_options = [
     'members',
-    'show-inheritance',
-    'show-module-summary',
-    'imported-members'
+    'show-module-summary'
 ]
 
 templates_path = ['_templates']
 
+# Never treat build output (including kept AutoAPI stubs from prior runs
+# under _build) as input; this also keeps the doctree cache reusable.
+exclude_patterns = ['_build']
+
 rst_prolog = """
 .. meta::
    :author: Martin F N Cooper
@@ -48,3 +73,19 @@ html_theme_options = {
     'prev_next_buttons_location': 'none'
 }
 html_show_sourcelink = False
+# No source links are shown, so don't copy the sources into the output
+# either; this halves the files written for every documented page.
+html_copy_source = False
+html_baseurl = 'https://pyham-pe.readthedocs.io/'
+
+
+# -- Application setup -------------------------------------------------------
+
+def setup(app):
+    # Everything this configuration adds is safe for parallel reading and
+    # writing, so declare as much to let builds benefit from '-j auto'.
+    return {
+        'parallel_read_safe': True,
+        'parallel_write_safe': True,
+        'version': release
+    }
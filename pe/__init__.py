@@ -18,11 +18,26 @@ Protocol reference:
 """
 
 __author__ = 'Martin F N Cooper'
-__version__ = '1.1.0'
+
+from pe._version import __version__
+
+__all__ = [
+    '__version__',
+    'DEF_HOST',
+    'DEF_PORT',
+    'SIG_ENGINE_READY',
+    'SIG_SERVER_CONNECTED',
+    'SIG_SERVER_DISCONNECTED',
+    'HeardCall',
+    'PacketEngine',
+    'PortCaps',
+    'ReceiveHandler'
+]
 
 from datetime import datetime
 from enum import Enum, auto
 import errno
+import functools
 import logging
 import re
 import socket
@@ -41,6 +56,15 @@ DEF_PORT = 8000         # Default port
 
 WSAENOTSOCK = 10038  # Windows error raised when socket is closed
 
+# Errors that indicate the connection is gone, as opposed to a genuine
+# failure; ConnectionResetError and ConnectionAbortedError are OSError
+# subclasses, so matching errnos covers them too
+_CLOSED_ERRNOS = frozenset(
+    {errno.EBADF, errno.ECONNRESET, errno.ECONNABORTED, WSAENOTSOCK})
+
+# Scatter-gather sends are not available on all platforms (e.g. Windows)
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
 logger = logging.getLogger('pe')
 logger.addHandler(logging.NullHandler())
 
@@ -160,7 +184,7 @@ class ReceiveHandler:
         :param str call_from: Callsign of station sending the data.
         :param str call_to: Callsign of station receiving the data.
         :param int pid: The PID corresponding to the incoming data.
-        :param bytearray data: The incoming data.
+        :param bytes data: The incoming data.
         """
         pass
 
@@ -206,7 +230,7 @@ class ReceiveHandler:
         :param str call_from: Callsign of sending station.
         :param str call_to: Callsign of destination station.
         :param str text: Textual representation of frame, in AGWPE format.
-        :param bytearray data: Data associated with the frame.
+        :param bytes data: Data associated with the frame.
         """
         pass
 
@@ -235,7 +259,7 @@ class ReceiveHandler:
         :param str call_from: Callsign of sending station.
         :param str call_to: Callsign of destination station.
         :param str text: Textual representation of frame, in AGWPE format.
-        :param bytearray data: Data associated with the frame.
+        :param bytes data: Data associated with the frame.
         """
         pass
 
@@ -250,7 +274,7 @@ class ReceiveHandler:
         :param str call_from: Callsign of sending station.
         :param str call_to: Callsign of destination station.
         :param str text: Textual representation of frame, in AGWPE format.
-        :param bytearray data: Data associated with the frame.
+        :param bytes data: Data associated with the frame.
         """
         pass
 
@@ -262,13 +286,14 @@ class ReceiveHandler:
         Corresponding frame type: 'K'
 
         :param int port: Port on which frame was received.
-        :param bytearray data: Raw AX.25 frame data.
+        :param bytes data: Raw AX.25 frame data.
         """
         pass
 
 
-_PCAPS_LEN = 12     # Port caps length
-_PCAPS_FMT = '8BI'  # Format for port caps unpack
+# Precompiled layout; explicit little-endian so that no platform-dependent
+# alignment padding can creep in.
+_PCAPS_STRUCT = struct.Struct('<8BI')
 
 
 class PortCaps(NamedTuple):
@@ -308,18 +333,31 @@ class PortCaps(NamedTuple):
         :rtype: PortCaps
         :raises ValueError: if the length of the provided data is invalid.
         """
-        if len(buffer) != _PCAPS_LEN:
+        if len(buffer) != _PCAPS_STRUCT.size:
             raise ValueError(
-                'Invalid capabilities length: ' + str(len(buffer)))
-        (baud_rate, traffic_level, tx_delay, tx_tail, persist, slot_time,
-            max_frame, active_connections, bytes_received) = struct.unpack(
-            _PCAPS_FMT, buffer)
-        return cls(baud_rate, traffic_level, tx_delay, tx_tail, persist,
-                   slot_time, max_frame, active_connections, bytes_received)
+                f'Invalid capabilities length: {len(buffer)}')
+        # Field order in the struct matches the field order above
+        return cls(*_PCAPS_STRUCT.unpack(buffer))
+
+
+# Precompiled SYSTEMTIME layout, skipping the day-of-week field
+_ST_STRUCT = struct.Struct('<HHxxHHHHH')
+
+# Base callsign of up to 6 characters, with an optional SSID of 0 - 15
+_CALLSIGN_RE = re.compile(
+    r'\A[A-Z0-9]{1,6}(?:-(?:[0-9]|1[0-5]))?\Z', re.IGNORECASE)
+
+# Data length field within the text portion of a monitored frame
+_LEN_RE = re.compile(r' Len=(\d+) ')
 
+# Login frame payload: userid and password, each in a 255-byte field
+_LOGIN_STRUCT = struct.Struct('255s255s')
 
-_ST_LEN = 16
-_ST_FMT = 'HHxxHHHHH'
+# Version ('R') frame payload: major and minor, each with 2 pad bytes
+_VERSION_STRUCT = struct.Struct('H2xH2x')
+
+# Frames-outstanding ('Y' / 'y') frame payload
+_UINT32_STRUCT = struct.Struct('I')
 
 
 class HeardCall(NamedTuple):
@@ -352,17 +390,23 @@ class HeardCall(NamedTuple):
         :returns: A new HeardCall instance.
         :rtype: HeardCall
         """
-        parts = buffer.split(b'\x00', 1)
+        # Locate the end of the text portion without splitting, so that
+        # only the piece being parsed is ever sliced out of the buffer
+        idx = buffer.find(b'\x00')
+        if idx < 0:
+            head, tail = buffer, b''
+        else:
+            head, tail = buffer[:idx], buffer[idx + 1:]
 
-        text_parts = HeardCall._parse_text(parts[0])
+        text_parts = HeardCall._parse_text(head)
         # If text parts are invalid, either it's an empty record or a bad one
         if text_parts is None:
             return None
 
         # There may or may not be timestamp data
-        if len(parts[1]) >= _ST_LEN * 2:
+        if len(tail) >= _ST_STRUCT.size * 2:
             try:
-                tstamps = HeardCall._parse_timestamps(parts[1])
+                tstamps = HeardCall._parse_timestamps(tail)
             except (struct.error, ValueError):
                 tstamps = (None, None)
         else:
@@ -377,8 +421,10 @@ class HeardCall(NamedTuple):
     def _parse_text(buffer):
         # Shortest possible string with callsign and two timestamps.
         _MIN_VIABLE_LEN = len("ID 615 925")  # noqa: N806
+        # Callsign and heard-time data are strict ASCII, which also gives
+        # us the cheapest possible decode path
         try:
-            text = buffer.decode('utf-8')
+            text = buffer.decode('ascii')
         except UnicodeDecodeError:
             return None
         if len(text) < _MIN_VIABLE_LEN:
@@ -392,15 +438,11 @@ class HeardCall(NamedTuple):
         # present (though likely zeroed out, as in the spec).
         if len(parts) < 3 or len(parts) % 2 == 0:
             return None
-        call_parts = parts[0].split('-')
-        # Callsign may or may not have an SSID, but can only be one or two
-        # parts. The base call must be alphanumeric.
-        if len(call_parts) > 2 or not call_parts[0].isalnum():
+        # Callsign may or may not have an SSID; the base call must be
+        # alphanumeric, and any SSID must be in the valid range. A single
+        # precompiled regex checks all of that in one pass.
+        if not _CALLSIGN_RE.match(parts[0]):
             return None
-        # If there is an SSID, it must be numeric and in the valid range.
-        if len(call_parts) == 2:
-            if not call_parts[1].isdecimal() or int(call_parts[1]) > 15:
-                return None
         # We don't know how many pieces comprise each timestamp, but we know
         # there are two timestamps, so divide the parts in two and join each
         # set of pieces to construct the string form.
@@ -416,40 +458,32 @@ class HeardCall(NamedTuple):
         #  * AGWPE has extra nulls before the timestamps
         #  * ldsped < v1.18 has correct buffer size, data all nulls
         #  * ldsped >= v1.19 has correct buffer size, correct data
-        expected_len = _ST_LEN * 2
+        expected_len = _ST_STRUCT.size * 2
         actual_len = len(buffer)
+        # Candidate offsets for the timestamp pair, in order of preference:
+        # the AGWPE case puts the data at the end with leading nulls, so
+        # when the buffer is over-long, try that position before falling
+        # back to the start of the buffer.
         if actual_len == expected_len:
-            ts1 = struct.unpack_from(_ST_FMT, buffer, 0)
-            ts2 = struct.unpack_from(_ST_FMT, buffer, _ST_LEN)
-            if ts1[0] == 0 and ts2[0] == 0:
-                # Looks like ldsped <= v1.18, no data
-                return (None, None)
-            if not ((2000 < ts1[0] < 2200) and (2000 < ts2[0] < 2200)):
-                # Data looks bogus, no other options to try
-                return (None, None)
+            offsets = (0,)
         else:
-            # Try AGWPE case, data at end with leading nulls
-            offset = actual_len - expected_len
-            ts1 = struct.unpack_from(_ST_FMT, buffer, offset)
-            ts2 = struct.unpack_from(_ST_FMT, buffer, offset + _ST_LEN)
-            if not ((2000 < ts1[0] < 2200) and (2000 < ts2[0] < 2200)):
-                # Data looks bogus, one last option to try
-                ts1 = struct.unpack_from(_ST_FMT, buffer, 0)
-                ts2 = struct.unpack_from(_ST_FMT, buffer, _ST_LEN)
-                if not ((2000 < ts1[0] < 2200) and (2000 < ts2[0] < 2200)):
-                    # Data looks bogus, no other options to try
-                    return (None, None)
-
-        # Data looks good, convert to datetime instances
-        return (
-            HeardCall._systemtime_to_datetime(ts1),
-            HeardCall._systemtime_to_datetime(ts2))
+            offsets = (actual_len - expected_len, 0)
+        for offset in offsets:
+            ts1 = _ST_STRUCT.unpack_from(buffer, offset)
+            ts2 = _ST_STRUCT.unpack_from(buffer, offset + _ST_STRUCT.size)
+            if (2000 < ts1[0] < 2200) and (2000 < ts2[0] < 2200):
+                # Data looks good, convert to datetime instances
+                return (
+                    HeardCall._systemtime_to_datetime(ts1),
+                    HeardCall._systemtime_to_datetime(ts2))
+        # Data absent (e.g. all nulls from ldsped <= v1.18) or bogus
+        return (None, None)
 
     @staticmethod
     def _systemtime_to_datetime(st):
-        vals = list(st)
-        vals[6] *= 1000  # st uses millis, dt uses micros
-        return datetime(*vals)
+        # st uses millis, dt uses micros
+        return datetime(
+            st[0], st[1], st[2], st[3], st[4], st[5], st[6] * 1000)
 
 
 class PacketEngine:
@@ -462,6 +496,26 @@ class PacketEngine:
     connecting to the server.
     """
 
+    __slots__ = (
+        '_ready',
+        '_sock',
+        '_receiver',
+        '_client_handler',
+        '_active_handler',
+        '_monitor_enabled',
+        '_raw_enabled',
+        '_registered_callsigns',
+        '_version_info',
+        '_port_info',
+        '_port_caps',
+        '_rx_buf',
+        '_rx_chunk',
+        '_send_scratch',
+        '_send_lock',
+        '_frame_dispatch',
+        '_frame_dlen'
+    )
+
     def __init__(self, handler=None):
         self._ready = False
         self._sock = None
@@ -470,38 +524,40 @@ class PacketEngine:
         self._active_handler = None
         self._monitor_enabled = False
         self._raw_enabled = False
-        self._registered_callsigns = []
+        self._registered_callsigns = set()
         self._version_info = None
         self._port_info = None
         self._port_caps = None
+        self._rx_buf = bytearray()
+        self._rx_chunk = bytearray(_BUF_LEN)
+        # Reusable frame assembly buffer; the lock also serializes
+        # sends from multiple threads so frames cannot interleave
+        self._send_scratch = bytearray(_BUF_LEN)
+        self._send_lock = threading.Lock()
+        # Precomputed per-kind dispatch and expected-length tables, so
+        # that the receive loop does dict lookups rather than getattr
+        # with a constructed name on every frame
+        self._frame_dispatch = {
+            kind: getattr(self, '_frame_received_' + kind, None)
+            for kind in _FRAME_INFO}
+        self._frame_dlen = {
+            kind: info[1] for kind, info in _FRAME_INFO.items()}
         if handler:
             self.receive_handler = handler
 
     def __repr__(self):
-        return ("PacketEngine("
-                "_ready={}, "
-                "_sock={}, "
-                "_receiver={}, "
-                "_client_handler={}, "
-                "_active_handler={}, "
-                "_monitor_enabled={}, "
-                "_raw_enabled={}, "
-                "_registered_callsigns={}, "
-                "_version_info={}, "
-                "_port_info={}, "
-                "_port_caps={})").format(
-            self._ready,
-            self._sock,
-            self._receiver,
-            self._client_handler,
-            self._active_handler,
-            self._monitor_enabled,
-            self._raw_enabled,
-            self._registered_callsigns,
-            self._version_info,
-            self._port_info,
-            self._port_caps
-        )
+        return (f"PacketEngine("
+                f"_ready={self._ready}, "
+                f"_sock={self._sock}, "
+                f"_receiver={self._receiver}, "
+                f"_client_handler={self._client_handler}, "
+                f"_active_handler={self._active_handler}, "
+                f"_monitor_enabled={self._monitor_enabled}, "
+                f"_raw_enabled={self._raw_enabled}, "
+                f"_registered_callsigns={self._registered_callsigns}, "
+                f"_version_info={self._version_info}, "
+                f"_port_info={self._port_info}, "
+                f"_port_caps={self._port_caps})")
 
     #
     # Packet Engine client
@@ -548,7 +604,18 @@ class PacketEngine:
         if self._ready:
             raise ValueError('Already connected')
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Generous kernel buffers absorb monitor-traffic bursts without
+        # stalling the sender while the receive thread catches up. Set
+        # before connect, since the window is negotiated at that point.
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCK_BUF)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCK_BUF)
         self._sock.connect((host, port))
+        # AGWPE command frames are tiny and often sent back to back; with
+        # Nagle enabled, each can stall behind the previous frame's ACK.
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Discard any partial frame left over if a previous session's
+        # receive thread died, so a reconnect starts parsing cleanly
+        del self._rx_buf[:]
         self._receiver = _ReceiveThread(self)
         self._receiver.start()
         self._active_handler = _InitializingHandler(self, self._engine_ready)
@@ -569,7 +636,7 @@ class PacketEngine:
         on this class after this call, except to (re)connect to a server.
         """
         self._ready = False
-        self._receiver.active = False
+        self._receiver.stop_event.set()
         try:
             self._sock.shutdown(socket.SHUT_RDWR)
             self._sock.close()
@@ -608,7 +675,7 @@ class PacketEngine:
         # Ignore if already registered
         if callsign in self._registered_callsigns:
             return
-        h = _Header(0, 'X', 0, callsign, '', 0)
+        h = _Header(0, _KIND_REGISTER, 0, callsign, '', 0)
         self._send_frame(h)
         # Local registration happens when PE confirms via 'X' frame
 
@@ -624,11 +691,10 @@ class PacketEngine:
         # Ignore if not registered
         if callsign not in self._registered_callsigns:
             return
-        h = _Header(0, 'x', 0, callsign, '', 0)
+        h = _Header(0, _KIND_UNREGISTER, 0, callsign, '', 0)
         self._send_frame(h)
         # Assume it works, since PE does not confirm
-        if callsign in self._registered_callsigns:
-            self._registered_callsigns.remove(callsign)
+        self._registered_callsigns.discard(callsign)
 
     def is_callsign_registered(self, callsign):
         """
@@ -649,8 +715,7 @@ class PacketEngine:
 
         Corresponding frame type: 'G'
         """
-        h = _Header(0, 'G', 0, '', '', 0)
-        self._send_frame(h)
+        self._send_packed(_FRAME_PORT_INFO)
         # Local cache created when PE returns 'G' frame
 
     def get_cached_port_info(self):
@@ -675,8 +740,7 @@ class PacketEngine:
         # Ignore if no change of state
         if onoff == self._monitor_enabled:
             return
-        h = _Header(0, 'm', 0, '', '', 0)
-        self._send_frame(h)
+        self._send_packed(_FRAME_MONITOR)
         self._monitor_enabled = not self._monitor_enabled
 
     @property
@@ -701,8 +765,7 @@ class PacketEngine:
 
         Corresponding frame type: 'R'
         """
-        h = _Header(0, 'R', 0, '', '', 0)
-        self._send_frame(h)
+        self._send_packed(_FRAME_VERSION)
         # Local cache created when PE returns 'R' frame
 
     @property
@@ -730,8 +793,7 @@ class PacketEngine:
         # Ignore if no change of state
         if onoff == self._raw_enabled:
             return
-        h = _Header(0, 'k', 0, '', '', 0)
-        self._send_frame(h)
+        self._send_packed(_FRAME_RAW_AX25)
         self._raw_enabled = not self._raw_enabled
 
     @property
@@ -762,8 +824,7 @@ class PacketEngine:
 
         :param int port: Port for which capabilities are to be retrieved.
         """
-        h = _Header(port, 'g', 0, '', '', 0)
-        self._send_frame(h)
+        self._send_packed(_port_caps_frame(port))
         # Local cache created when PE returns 'g' frame
 
     def get_cached_port_caps(self, port):
@@ -804,15 +865,24 @@ class PacketEngine:
             raise ValueError('Invalid data')
         if not via:
             # No digipeaters - simple unproto frame
-            h = _Header(port, 'M', 0xF0, call_from, call_to, len(data))
+            h = _Header(
+                port, _KIND_UNPROTO, 0xF0, call_from, call_to, len(data))
             self._send_frame(h, data)
             return
-        # Frame data is Via list followed by unproto data
-        vias = [v.encode('utf-8') for v in via]
-        fmt = 'B' + len(via) * '10s'
-        frame_data = bytearray(struct.pack(fmt, len(via), *vias))
-        frame_data.extend(data)
-        h = _Header(port, 'V', 0xF0, call_from, call_to, len(frame_data))
+        # Frame data is Via list followed by unproto data, assembled in a
+        # single pass into an exactly-sized buffer. Each via occupies a
+        # 10-byte slot, NUL-padded by virtue of the zeroed buffer.
+        n_via = len(via)
+        frame_data = bytearray(1 + 10 * n_via + len(data))
+        frame_data[0] = n_via
+        offset = 1
+        for v in via:
+            encoded = v.encode('utf-8')[:10]
+            frame_data[offset:offset + len(encoded)] = encoded
+            offset += 10
+        frame_data[offset:] = data
+        h = _Header(
+            port, _KIND_UNPROTO_VIA, 0xF0, call_from, call_to, len(frame_data))
         self._send_frame(h, frame_data)
 
     def connect(self, port, call_from, call_to, via=None, pid=None):
@@ -844,19 +914,19 @@ class PacketEngine:
             # with vias, which is why the pid handling is in here.
             if pid is None:
                 pid = 0xF0
-                data_kind = 'C'
+                data_kind = _KIND_CONNECT
             else:
                 if not (0 <= pid <= 0xFF):
                     raise ValueError('Invalid pid value: {}'.format(pid))
-                data_kind = 'c'
+                data_kind = _KIND_CONNECT_PID
             h = _Header(port, data_kind, pid, call_from, call_to, 0)
             self._send_frame(h)
             return
         # Construct Via list
         vias = [v.encode('utf-8') for v in via]
-        fmt = 'B' + len(via) * '10s'
-        frame_data = struct.pack(fmt, len(via), *vias)
-        h = _Header(port, 'v', 0xF0, call_from, call_to, len(frame_data))
+        frame_data = _via_struct(len(via)).pack(len(via), *vias)
+        h = _Header(
+            port, _KIND_CONNECT_VIA, 0xF0, call_from, call_to, len(frame_data))
         self._send_frame(h, frame_data)
         # Confirmation happens when PE confirms via 'C' frame
 
@@ -883,7 +953,7 @@ class PacketEngine:
             pid = 0xF0
         elif not (0 <= pid <= 0xFF):
             raise ValueError('Invalid pid value: {}'.format(pid))
-        h = _Header(port, 'D', pid, call_from, call_to, len(data))
+        h = _Header(port, _KIND_DATA, pid, call_from, call_to, len(data))
         self._send_frame(h, data)
 
     def disconnect(self, port, call_from, call_to):  # 'd' frame
@@ -902,7 +972,7 @@ class PacketEngine:
         # Error if not registered
         if call_from not in self._registered_callsigns:
             raise ValueError('Callsign must be registered')
-        h = _Header(port, 'd', 0xF0, call_from, call_to, 0)
+        h = _Header(port, _KIND_DISCONNECT, 0xF0, call_from, call_to, 0)
         self._send_frame(h)
         # Confirmation happens when PE confirms via 'd' frame
 
@@ -918,7 +988,7 @@ class PacketEngine:
         :param data: The AX.25 frame to be sent.
         :type data: bytes or bytearray
         """
-        h = _Header(port, 'K', 0, call_from, call_to, len(data))
+        h = _Header(port, _KIND_RAW, 0, call_from, call_to, len(data))
         self._send_frame(h, data)
 
     def ask_callsigns_heard_on_port(self, port):  # 'H' frame
@@ -929,7 +999,7 @@ class PacketEngine:
 
         :param int port: Port to query for heard callsigns.
         """
-        h = _Header(port, 'H', 0, '', '', 0)
+        h = _Header(port, _KIND_HEARD, 0, '', '', 0)
         self._send_frame(h)
 
     def ask_frames_waiting_on_port(self, port):  # 'y' frame
@@ -941,7 +1011,7 @@ class PacketEngine:
 
         :param int port: Port to query for outstanding frames.
         """
-        h = _Header(port, 'y', 0, '', '', 0)
+        h = _Header(port, _KIND_FRAMES_PORT, 0, '', '', 0)
         self._send_frame(h)
 
     def ask_frames_waiting_on_connection(self, port, call_from, call_to):
@@ -956,7 +1026,7 @@ class PacketEngine:
         :param str call_from: Callsign of source station.
         :param str call_to: Callsign of destination station.
         """
-        h = _Header(port, 'Y', 0, call_from, call_to, 0)
+        h = _Header(port, _KIND_FRAMES_CONN, 0, call_from, call_to, 0)
         self._send_frame(h)
 
     def login(self, userid, password):  # 'P' frame
@@ -985,38 +1055,65 @@ class PacketEngine:
             userid = userid.encode('utf-8')
         if isinstance(password, str):
             password = password.encode('utf-8')
-        data = bytearray(255 * 2)
-        data[0:len(userid)] = userid
-        data[255:255 + len(password)] = password
-        h = _Header(0, 'P', 0, '', '', len(data))
+        # The 's' format zero-pads each field to its full width, so this
+        # builds the two fixed 255-byte fields in one step
+        data = _LOGIN_STRUCT.pack(userid, password)
+        h = _Header(0, _KIND_LOGIN, 0, '', '', len(data))
         self._send_frame(h, data)
 
     #
     # Internals
     #
 
+    def _send_packed(self, frame):
+        # Serialized with _send_frame, so a command frame cannot land in
+        # the middle of another thread's partially sent data frame
+        with self._send_lock:
+            self._sock.sendall(frame)
+
     def _send_frame(self, header, data=None):
-        buffer = bytearray(header.pack())
-        if data:
-            if isinstance(data, str):
-                data = data.encode('utf-8')
-            buffer.extend(data)
-        blen = len(buffer)
-        while True:
-            sent = self._sock.send(buffer)
-            blen -= sent
-            if not blen:
-                break
-            buffer = buffer[sent:]
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        # Frames are assembled in a per-engine scratch buffer, so there
+        # are no allocations here after warm-up; the lock keeps frames
+        # from different threads from interleaving on the wire
+        with self._send_lock:
+            scratch = self._send_scratch
+            if not data:
+                header.pack_into(scratch)
+                self._sock.sendall(memoryview(scratch)[:_HDR_LEN])
+            elif _HAS_SENDMSG:
+                # Scatter-gather send: header and payload go out in a
+                # single syscall, without being copied into a combined
+                # buffer. In the common case the loop runs exactly once;
+                # partial sends just advance the buffer list and retry.
+                header.pack_into(scratch)
+                bufs = [memoryview(scratch)[:_HDR_LEN], memoryview(data)]
+                while bufs:
+                    sent = self._sock.sendmsg(bufs)
+                    while bufs and sent >= len(bufs[0]):
+                        sent -= len(bufs[0])
+                        del bufs[0]
+                    if sent:
+                        bufs[0] = bufs[0][sent:]
+            else:
+                # No sendmsg on this platform (Windows); assemble header
+                # and payload into the scratch buffer, grown on demand,
+                # and send the combined frame.
+                total = _HDR_LEN + len(data)
+                if total > len(scratch):
+                    scratch.extend(bytes(total - len(scratch)))
+                header.pack_into(scratch)
+                scratch[_HDR_LEN:total] = data
+                self._sock.sendall(memoryview(scratch)[:total])
 
     def _frame_received(self, header, data):
         key = header.data_kind
-        if key not in _FRAME_INFO:
+        dlen = self._frame_dlen.get(key)
+        if dlen is None:
             self._frame_received_error(
                 header, data, 'unknown kind: {}'.format(header.data_kind))
             return
-        info = _FRAME_INFO[key]
-        dlen = info[1]
         if dlen == _UNDEF:
             self._frame_received_error(header, data, 'not permitted')
             return
@@ -1026,27 +1123,28 @@ class PacketEngine:
                 'wrong data length; received {} instead of {}'.format(
                     header.data_len, dlen))
             return
-        try:
-            fn = getattr(self, '_frame_received_' + key)
-        except AttributeError:
+        fn = self._frame_dispatch[key]
+        if fn is None:
             self._frame_received_unsupported(header, data)
-        else:
-            try:
-                fn(header, data)
-            except Exception as e:
-                msg = '{} (raised from {})'.format(str(e), str(fn))
-                self._frame_received_error(header, data, msg)
+            return
+        try:
+            fn(header, data)
+        except Exception as e:
+            msg = '{} (raised from {})'.format(str(e), str(fn))
+            self._frame_received_error(header, data, msg)
 
     def _frame_received_error(self, header, data, msg):
-        logger.error('Received frame error: {}'.format(msg))
+        logger.error('Received frame error: %s', msg)
 
     def _frame_received_unsupported(self, header, data):
         logger.warning(
-            'Discarding unsupported frame, kind={}'.format(header.data_kind))
+            'Discarding unsupported frame, kind=%s', header.data_kind)
 
     def _frame_received_C(self, header, data):
+        # Classify incoming vs outgoing on the raw bytes; the decode is
+        # needed only for the message passed along to the handler
+        incoming = data.startswith(b'*** CONNECTED To ')
         message = data.decode('utf-8')
-        incoming = message.startswith('*** CONNECTED To ')
         self._active_handler.connection_received(
             header.port, header.call_from, header.call_to, incoming, message)
 
@@ -1062,7 +1160,10 @@ class PacketEngine:
     def _frame_received_G(self, header, data):
         # In some cases, AGWPE sends a too-long buffer with garbage after the
         # first zero byte, so we can't just strip trailing zero bytes.
-        parts = data.split(bytearray(1), 1)[0].decode('utf-8').split(';')
+        end = data.find(b'\x00')
+        if end >= 0:
+            data = data[:end]
+        parts = data.decode('utf-8').split(';')
         info = [x for x in parts[1:] if x]
         self._port_info = info
         self._active_handler.port_info(info)
@@ -1087,7 +1188,7 @@ class PacketEngine:
         self._active_handler.monitored_raw(header.port, data)
 
     def _frame_received_R(self, header, data):
-        major, minor = struct.unpack('H2xH2x', data)
+        major, minor = _VERSION_STRUCT.unpack(data)
         self._version_info = (major, minor)
         self._active_handler.version_info(major, minor)
 
@@ -1107,18 +1208,18 @@ class PacketEngine:
             header.port, header.call_from, header.call_to, text, data)
 
     def _frame_received_X(self, header, data):
-        if data[0] and header.call_from not in self._registered_callsigns:
-            self._registered_callsigns.append(header.call_from)
+        if data[0]:
+            self._registered_callsigns.add(header.call_from)
         self._active_handler.callsign_registered(
             header.call_from, data[0] != 0)
 
     def _frame_received_Y(self, header, data):
-        (frames,) = struct.unpack('I', data)
+        (frames,) = _UINT32_STRUCT.unpack(data)
         self._active_handler.frames_waiting_on_connection(
             header.port, header.call_from, header.call_to, frames)
 
     def _frame_received_y(self, header, data):
-        (frames,) = struct.unpack('I', data)
+        (frames,) = _UINT32_STRUCT.unpack(data)
         self._active_handler.frames_waiting_on_port(header.port, frames)
 
     def parse_monitor_data(self, rawdata):
@@ -1126,8 +1227,17 @@ class PacketEngine:
         if len(pieces) != 2:
             # Invalid - just return raw data
             return [None, rawdata]
-        text = pieces[0].decode('utf-8', 'replace')
-        m = re.search(r' Len=(\d+) ', text)
+        head = pieces[0]
+        text = head.decode('utf-8', 'replace')
+        # Fast path: locate the length field on the raw bytes, avoiding
+        # a regex pass over the decoded text for well-formed headers
+        idx = head.find(b' Len=')
+        if idx >= 0:
+            start = idx + 5
+            end = head.find(b' ', start)
+            if end > start and head[start:end].isdigit():
+                return [text, pieces[1][:int(head[start:end])]]
+        m = _LEN_RE.search(text)
         if not m:
             # Invalid - return all received data
             return [text, pieces[1]]
@@ -1135,60 +1245,94 @@ class PacketEngine:
         return [text, pieces[1][:int(m[1])]]
 
     def _receive_data(self):
-        buffer = bytearray()
+        # Receive into a reusable scratch buffer and parse frames out of a
+        # persistent accumulation buffer, tracking the parse position with
+        # an integer cursor rather than re-slicing the remainder for every
+        # frame consumed.
+        buffer = self._rx_buf
+        chunk = self._rx_chunk
+        head = 0
         header = None
 
         while True:
-            break_out = False
             try:
-                data = self._sock.recv(_BUF_LEN)
-            except ConnectionResetError:  # Server went away
-                break_out = True
-            except ConnectionAbortedError:  # Host closed connection
-                break_out = True
+                nread = self._sock.recv_into(chunk)
             except OSError as e:
-                if e.errno in (errno.EBADF, WSAENOTSOCK):
-                    # Socket closed
-                    break_out = True
+                # Server went away, host closed connection, or our own
+                # socket was closed out from under us
+                if e.errno in _CLOSED_ERRNOS:
+                    nread = 0
                 else:
                     raise
-            if break_out or not data:
+            if not nread:  # Normal EOF, or closed as above
+                del buffer[:]
                 return
-            buffer += data
-            blen = len(buffer)
+            buffer += memoryview(chunk)[:nread]
+            avail = len(buffer) - head
 
             while True:
                 if not header:
-                    if blen < _HDR_LEN:
+                    if avail < _HDR_LEN:
                         break
-                    header = _Header.unpack(buffer[:_HDR_LEN])
-                    buffer = buffer[_HDR_LEN:]
-                    blen -= _HDR_LEN
+                    header = _Header.unpack_from(buffer, head)
+                    head += _HDR_LEN
+                    avail -= _HDR_LEN
                 dlen = header.data_len
-                if dlen > blen:
+                if dlen > avail:
                     break
-                self._frame_received(header, buffer[:dlen])
-                buffer = buffer[dlen:]
-                blen = len(buffer)
+                # Hand the handler an immutable copy of just the payload;
+                # an owned bytes is safe for handlers to retain, unlike a
+                # view into the receive buffer
+                self._frame_received(
+                    header, bytes(memoryview(buffer)[head:head + dlen]))
+                head += dlen
+                avail -= dlen
                 header = None
 
+            # Drop consumed bytes once the dead prefix dominates the
+            # buffer (or passes an absolute cap), rather than shifting
+            # the unconsumed tail down after every recv
+            if head > 65536 or head > len(buffer) // 2:
+                del buffer[:head]
+                head = 0
+
 
 class _ReceiveThread(threading.Thread):
     def __init__(self, engine):
         self.engine = engine
-        self.active = True
-        super().__init__()
+        self.stop_event = threading.Event()
+        # A daemon thread cannot block interpreter shutdown if the
+        # client exits without disconnecting
+        super().__init__(daemon=True)
 
     def run(self):
-        while self.active:
+        while not self.stop_event.is_set():
             self.engine._receive_data()
 
 
-_BUF_LEN = 4096  # Buffer length for socket i/o
+_BUF_LEN = 4096        # Buffer length for socket i/o
+_SOCK_BUF = 256 * 1024  # Requested kernel send / receive buffer size
 
 _VARDATA = -1   # Variable frame data size
 _UNDEF   = -2   # Frame undefined for this direction
 
+# Kinds for outbound frames, preconverted to their byte values so that
+# no per-frame str -> int conversion is needed when packing headers
+_KIND_REGISTER    = ord('X')
+_KIND_UNREGISTER  = ord('x')
+_KIND_UNPROTO     = ord('M')
+_KIND_UNPROTO_VIA = ord('V')
+_KIND_CONNECT     = ord('C')
+_KIND_CONNECT_PID = ord('c')
+_KIND_CONNECT_VIA = ord('v')
+_KIND_DATA        = ord('D')
+_KIND_DISCONNECT  = ord('d')
+_KIND_RAW         = ord('K')
+_KIND_HEARD       = ord('H')
+_KIND_FRAMES_PORT = ord('y')
+_KIND_FRAMES_CONN = ord('Y')
+_KIND_LOGIN       = ord('P')
+
 _FRAME_INFO = {
     #        Send       Recv      Name
     'P': [ _VARDATA,   _UNDEF, 'Application Login'],
@@ -1218,6 +1362,42 @@ _FRAME_INFO = {
 
 _HDR_LEN = 36                     # Header length
 _HDR_FMT = 'BxxxBxBx10s10sIxxxx'  # Format for header pack / unpack
+_HDR_STRUCT = struct.Struct(_HDR_FMT)  # Precompiled form of the above
+
+# Prepacked frames for the commands whose content never varies
+_FRAME_PORT_INFO = _HDR_STRUCT.pack(0, ord('G'), 0, b'', b'', 0)
+_FRAME_VERSION   = _HDR_STRUCT.pack(0, ord('R'), 0, b'', b'', 0)
+_FRAME_MONITOR   = _HDR_STRUCT.pack(0, ord('m'), 0, b'', b'', 0)
+_FRAME_RAW_AX25  = _HDR_STRUCT.pack(0, ord('k'), 0, b'', b'', 0)
+
+
+@functools.lru_cache(maxsize=32)
+def _port_caps_frame(port):
+    return _HDR_STRUCT.pack(port, ord('g'), 0, b'', b'', 0)
+
+
+# A client typically cycles through a small set of callsigns, so cache
+# their encoded forms rather than re-encoding on every outbound frame.
+@functools.lru_cache(maxsize=64)
+def _encoded_callsign(callsign):
+    return bytes(callsign, 'utf-8', 'replace')
+
+
+# Via-list payloads vary only in the number of digipeaters, so the
+# compiled form for each count can be reused
+@functools.lru_cache(maxsize=8)
+def _via_struct(count):
+    return struct.Struct('B' + '10s' * count)
+
+
+def _decode_callsign(raw):
+    # Strip the NUL padding before decoding, and try ASCII first;
+    # callsigns are ASCII in practice, and that is the cheapest decode
+    raw = raw.rstrip(b'\x00')
+    try:
+        return raw.decode('ascii')
+    except UnicodeDecodeError:
+        return raw.decode('utf-8', 'replace')
 
 
 class _Header:
@@ -1227,14 +1407,37 @@ class _Header:
     (when packed).
     """
 
+    __slots__ = (
+        'port', 'data_kind', 'pid', '_call_from', '_call_to', 'data_len')
+
     def __init__(self, port, data_kind, pid, call_from, call_to, data_len):
         self.port = port
         self.data_kind = data_kind
         self.pid = pid
-        self.call_from = call_from
-        self.call_to = call_to
+        self._call_from = call_from
+        self._call_to = call_to
         self.data_len = data_len
 
+    # The callsign fields arrive as NUL-padded bytes but are consumed as
+    # strings only by some frame handlers, so the decode is deferred
+    # until (unless) a field is actually read
+
+    @property
+    def call_from(self):
+        value = self._call_from
+        if isinstance(value, bytes):
+            value = _decode_callsign(value)
+            self._call_from = value
+        return value
+
+    @property
+    def call_to(self):
+        value = self._call_to
+        if isinstance(value, bytes):
+            value = _decode_callsign(value)
+            self._call_to = value
+        return value
+
     def __repr__(self):
         return ("_Header("
                 "port={}, "
@@ -1252,23 +1455,34 @@ class _Header:
             self.data_len
         )
 
+    def _kind_byte(self):
+        kind = self.data_kind
+        return kind if isinstance(kind, int) else ord(kind)
+
     def pack(self):
-        call_from = bytes(self.call_from, 'utf-8', 'replace')
-        call_to = bytes(self.call_to, 'utf-8', 'replace')
-        return struct.pack(
-            _HDR_FMT, self.port, ord(self.data_kind), self.pid,
-            call_from, call_to, self.data_len)
+        return _HDR_STRUCT.pack(
+            self.port, self._kind_byte(), self.pid,
+            _encoded_callsign(self.call_from), _encoded_callsign(self.call_to),
+            self.data_len)
+
+    def pack_into(self, buffer, offset=0):
+        _HDR_STRUCT.pack_into(
+            buffer, offset, self.port, self._kind_byte(), self.pid,
+            _encoded_callsign(self.call_from), _encoded_callsign(self.call_to),
+            self.data_len)
+
+    @classmethod
+    def unpack(cls, buffer):
+        if len(buffer) != _HDR_LEN:
+            raise ValueError(f'Invalid header length: {len(buffer)}')
+        return cls.unpack_from(buffer)
 
     @classmethod
-    def unpack(cls, bytes):
-        if len(bytes) != _HDR_LEN:
-            raise ValueError('Invalid header length: ' + str(len(bytes)))
-        (port, data_kind, pid, call_from, call_to, data_len) = struct.unpack(
-            _HDR_FMT, bytes)
-        data_kind = chr(data_kind)
-        call_from = call_from.decode('utf-8', 'replace').rstrip('\0')
-        call_to = call_to.decode('utf-8', 'replace').rstrip('\0')
-        return cls(port, data_kind, pid, call_from, call_to, data_len)
+    def unpack_from(cls, buffer, offset=0):
+        (port, data_kind, pid, call_from, call_to,
+         data_len) = _HDR_STRUCT.unpack_from(buffer, offset)
+        # Callsigns are stored raw; decoded lazily by the properties
+        return cls(port, chr(data_kind), pid, call_from, call_to, data_len)
 
 
 class _ReadyState(Enum):
@@ -0,0 +1,13 @@
+# =============================================================================
+# Copyright (c) 2018-2024 Martin F N Cooper
+#
+# Author: Martin F N Cooper
+# License: MIT License
+# =============================================================================
+
+"""
+Package version, kept in a module of its own so that it can be read (e.g.
+by the docs build) without importing the full package.
+"""
+
+__version__ = '1.1.0'
@@ -13,7 +13,7 @@ higher level abstraction over the low level packet engine interface. Included
 is higher level connection handling and monitoring support.
 """
 
-import time
+import threading
 
 import pe
 import pe.connect
@@ -21,6 +21,10 @@ import pe.monitor
 import pe.handler
 import pe.tocsin
 
+# Time (in seconds) to wait for the engine to become ready after
+# connecting to the server, before giving up
+_READY_TIMEOUT = 30.0
+
 
 class NotConnectedError(Exception):
     """
@@ -63,6 +67,9 @@ class Application:
             most common cause is an incorrect host name.
         :raises ConnectionRefusedError: if the server refuses the attempt to
             connect. The most common cause is an incorrect port number.
+        :raises TimeoutError: if the server accepts the connection but the
+            engine does not become ready within 30 seconds. The most common
+            cause is a server that is not actually a PE server.
         """
         if not self._engine:
             self._start_engine(host, port)
@@ -265,19 +272,20 @@ class Application:
 
     def _start_engine(self, host, port):
         def ready(*unused):
-            nonlocal started
             self._engine = engine
             self._connections = connections
-            started = True
-        started = False
+            engine_ready.set()
+        engine_ready = threading.Event()
         pe.tocsin.signal(pe.SIG_ENGINE_READY).listen(ready)
         engine = pe.PacketEngine()
         connections = pe.connect.Connections(engine)
         engine.receive_handler = self._make_receive_handler(
             connections.receive_handler)
         engine.connect_to_server(host, port)
-        while not started:
-            time.sleep(0.1)
+        if not engine_ready.wait(_READY_TIMEOUT):
+            engine.disconnect_from_server()
+            raise TimeoutError(
+                'Timed out waiting for the engine to become ready')
         # register callsigns now?
 
     def _make_receive_handler(self, connection_receive_handler):
@@ -24,7 +24,8 @@ To use this layer, the following steps are required:
   create new connected-mode connections.
 """
 
-from enum import Enum, auto
+from enum import IntEnum, auto
+import functools
 
 from pe import ReceiveHandler
 
@@ -45,7 +46,7 @@ class ConnectionError(Exception):
     pass
 
 
-class ConnectionState(Enum):
+class ConnectionState(IntEnum):
     """
     The current state of a connection.
 
@@ -83,6 +84,12 @@ class Connection:
     """
     _connection_cls = None
 
+    # Subclasses that add attributes get a __dict__ of their own; the
+    # base attributes still benefit from slot storage
+    __slots__ = (
+        '_port', '_call_from', '_call_to', '_incoming', '_state',
+        '_engine', '_key')
+
     def __init__(self, port, call_from, call_to, incoming=False):
         self._port = port
         self._call_from = call_from
@@ -173,6 +180,13 @@ class Connection:
         """
         return False
 
+    def _bind(self, engine, key, state):
+        # Consolidated setup used when a connection is added to the map,
+        # whether opened locally or accepted from a remote station
+        self._engine = engine
+        self._key = key
+        self._state = state
+
     def send_data(self, data):
         """
         Send data on the currently open connection.
@@ -215,35 +229,47 @@ class Connection:
         incoming data.
 
         :param int pid: The PID corresponding to the incoming data.
-        :param bytearray data: The incoming data.
+        :param bytes data: The incoming data.
         """
         pass
 
 
+# Sentinel distinguishing "absent" from any real map entry
+_MISSING = object()
+
+
 class _ConnectionMap:
+    __slots__ = ('_connections',)
+
     def __init__(self):
         self._connections = {}
 
-    def _make_key(self, port, call_from, call_to):
-        calls = sorted([call_from, call_to])
-        return '{}:{}:{}'.format(port, *calls)
+    # Steady traffic on an established connection presents the same
+    # (port, from, to) triple on every frame, so cache the ordered key
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _make_key(port, call_from, call_to):
+        # Order the callsigns with a single comparison, rather than
+        # building and sorting a throwaway list. A tuple key hashes
+        # faster than a formatted string and avoids the allocation.
+        if call_from > call_to:
+            call_from, call_to = call_to, call_from
+        return (port, call_from, call_to)
 
     def find(self, port, call_from, call_to):
-        key = self._make_key(port, call_from, call_to)
-        return self._connections[key] if key in self._connections else None
+        return self._connections.get(self._make_key(port, call_from, call_to))
 
     def add(self, conn):
         key = self._make_key(conn._port, conn._call_from, conn._call_to)
         if key in self._connections:
             raise ValueError('Connection already exists')
-        conn._key = key
         self._connections[key] = conn
         return key
 
     def remove(self, conn):
-        if conn._key is None or conn._key not in self._connections:
+        key = conn._key
+        if key is None or self._connections.pop(key, _MISSING) is _MISSING:
             raise ValueError('Connection does not exist')
-        del self._connections[conn._key]
         conn._key = None
 
 
@@ -262,7 +288,8 @@ class Connections:
     def __init__(self, engine):
         self._engine = engine
         self._connection_map = _ConnectionMap()
-        self._receive_handler = None
+        self._receive_handler = _ConnectionReceiveHandler(
+            engine, self._connection_map)
 
     @property
     def receive_handler(self):
@@ -272,9 +299,6 @@ class Connections:
 
         :type: ReceiveHandler
         """
-        if not self._receive_handler:
-            self._receive_handler = _ConnectionReceiveHandler(
-                self._engine, self._connection_map)
         return self._receive_handler
 
     def open(self, port, call_from, call_to, via=None):
@@ -294,9 +318,8 @@ class Connections:
         if not Connection._connection_cls:
             raise ConnectionClassNotFoundError()
         conn = Connection._connection_cls(port, call_from, call_to)
-        conn._engine = self._engine
-        self._connection_map.add(conn)
-        conn._state = ConnectionState.CONNECTING
+        key = self._connection_map.add(conn)
+        conn._bind(self._engine, key, ConnectionState.CONNECTING)
         self._engine.connect(port, call_from, call_to, via)
         return conn
 
@@ -312,19 +335,28 @@ class _ConnectionReceiveHandler(ReceiveHandler):
     def __init__(self, engine, connection_map):
         self._engine = engine
         self._connection_map = connection_map
+        # The client's Connection subclass and its bound accept query,
+        # captured on first use; the subclass may not be defined yet
+        # when this handler is constructed
+        self._conn_cls = None
+        self._query_accept = None
 
     def connection_received(self, port, call_from, call_to, incoming, message):
         conn = self._connection_map.find(port, call_from, call_to)
         if incoming:
             if conn:
                 return
-            if not Connection._connection_cls.query_accept(
-                    port, call_from, call_to):
+            cls = self._conn_cls
+            if cls is None:
+                cls = self._conn_cls = Connection._connection_cls
+                # Binding the classmethod once skips the descriptor
+                # traversal on subsequent incoming connections
+                self._query_accept = cls.query_accept
+            if not self._query_accept(port, call_from, call_to):
                 return
-            conn = Connection._connection_cls(port, call_from, call_to)
-            conn._engine = self._engine  # Needed in connection object?
-            conn._key = self._connection_map.add(conn)
-            conn._state = ConnectionState.CONNECTED
+            conn = cls(port, call_from, call_to)
+            key = self._connection_map.add(conn)
+            conn._bind(self._engine, key, ConnectionState.CONNECTED)
             conn.connected()
         else:
             if not conn:
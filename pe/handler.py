@@ -12,6 +12,7 @@ Helper implementations for :class:`ReceiveHandler` that assist in building
 chains of more specialized helpers, and in debugging said chains.
 """
 
+import inspect
 import logging
 
 from pe import ReceiveHandler
@@ -33,7 +34,10 @@ class MultiReceiveHandler(ReceiveHandler):
     #
 
     def __init__(self):
-        self._handlers = []
+        # Stored as a tuple: iteration is cheap, and a dispatch that is
+        # underway is unaffected if a handler adds or removes handlers
+        # mid-callback, since mutation rebinds rather than mutates
+        self._handlers = ()
 
     def add_handler(self, handler):
         """
@@ -48,7 +52,7 @@ class MultiReceiveHandler(ReceiveHandler):
         :rtype: MultiReceiveHandler
         """
         if handler not in self._handlers:
-            self._handlers.append(handler)
+            self._handlers += (handler,)
         return self
 
     def remove_handler(self, handler):
@@ -64,72 +68,40 @@ class MultiReceiveHandler(ReceiveHandler):
         :rtype: MultiReceiveHandler
         """
         if handler in self._handlers:
-            self._handlers.remove(handler)
+            handlers = list(self._handlers)
+            handlers.remove(handler)
+            self._handlers = tuple(handlers)
         return self
 
     #
-    # ReceiveHandler methods
+    # ReceiveHandler methods are generated below from the base class, so
+    # that the fan-out set cannot drift from the ReceiveHandler interface
     #
 
-    def version_info(self, major, minor):
-        for h in self._handlers:
-            h.version_info(major, minor)
-
-    def callsign_registered(self, callsign, success):
-        for h in self._handlers:
-            h.callsign_registered(callsign, success)
-
-    def port_info(self, info):
-        for h in self._handlers:
-            h.port_info(info)
-
-    def port_caps(self, port, caps):
-        for h in self._handlers:
-            h.port_caps(port, caps)
-
-    def callsign_heard_on_port(self, port, heard_call):
-        for h in self._handlers:
-            h.callsign_heard_on_port(port, heard_call)
-
-    def frames_waiting_on_port(self, port, frames):
-        for h in self._handlers:
-            h.frames_waiting_on_port(port, frames)
-
-    def connection_received(self, port, call_from, call_to, incoming, message):
-        for h in self._handlers:
-            h.connection_received(port, call_from, call_to, incoming, message)
-
-    def connected_data(self, port, call_from, call_to, pid, data):
-        for h in self._handlers:
-            h.connected_data(port, call_from, call_to, pid, data)
-
-    def disconnected(self, port, call_from, call_to, message):
-        for h in self._handlers:
-            h.disconnected(port, call_from, call_to, message)
-
-    def frames_waiting_on_connection(self, port, call_from, call_to, frames):
-        for h in self._handlers:
-            h.frames_waiting_on_connection(port, call_from, call_to, frames)
-
-    def monitored_connected(self, port, call_from, call_to, text, data):
-        for h in self._handlers:
-            h.monitored_connected(port, call_from, call_to, text, data)
 
-    def monitored_supervisory(self, port, call_from, call_to, text):
-        for h in self._handlers:
-            h.monitored_supervisory(port, call_from, call_to, text)
+def _make_dispatchers():
+    # For each public ReceiveHandler method, compile a fan-out method
+    # with the real (positional) signature. A chain of one handler --
+    # the common case -- delegates directly, skipping the loop.
+    template = (
+        'def {name}(self, {args}):\n'
+        '    handlers = self._handlers\n'
+        '    if len(handlers) == 1:\n'
+        '        return handlers[0].{name}({args})\n'
+        '    for handler in handlers:\n'
+        '        handler.{name}({args})\n'
+    )
+    for name, member in inspect.getmembers(ReceiveHandler,
+                                           inspect.isfunction):
+        if name.startswith('_'):
+            continue
+        args = ', '.join(list(inspect.signature(member).parameters)[1:])
+        namespace = {}
+        exec(template.format(name=name, args=args), namespace)
+        setattr(MultiReceiveHandler, name, namespace[name])
 
-    def monitored_unproto(self, port, call_from, call_to, text, data):
-        for h in self._handlers:
-            h.monitored_unproto(port, call_from, call_to, text, data)
 
-    def monitored_own(self, port, call_from, call_to, text, data):
-        for h in self._handlers:
-            h.monitored_own(port, call_from, call_to, text, data)
-
-    def monitored_raw(self, port, data):
-        for h in self._handlers:
-            h.monitored_raw(port, data)
+_make_dispatchers()
 
 
 class DebugReceiveHandler(ReceiveHandler):
@@ -160,89 +132,115 @@ class DebugReceiveHandler(ReceiveHandler):
     def enable_output(self, onoff):
         self._enable_output = onoff
 
-    def _debug_out(self, s):
-        if self._enable_output:
-            logger.debug(s)
-
     #
     # ReceiveHandler methods
     #
+    # Each method bails out before formatting anything when output is
+    # disabled (the default), since rendering the arguments -- notably
+    # large data buffers -- is the bulk of the cost here.
 
     def version_info(self, major, minor):
-        self._debug_out('version_info:\n  major: {}\n  minor: {}\n'.format(
-            major, minor))
+        if not self._enable_output:
+            return
+        logger.debug(
+            'version_info:\n  major: %s\n  minor: %s\n', major, minor)
 
     def callsign_registered(self, callsign, success):
-        self._debug_out(
-            ('callsign_registered:\n  callsign: {}\n'
-             '  success: {}\n').format(
-                callsign, success))
+        if not self._enable_output:
+            return
+        logger.debug(
+            'callsign_registered:\n  callsign: %s\n  success: %s\n',
+            callsign, success)
 
     def port_info(self, info):
-        self._debug_out('port_info:\n  info: {}\n'.format(info))
+        if not self._enable_output:
+            return
+        logger.debug('port_info:\n  info: %s\n', info)
 
     def port_caps(self, port, caps):
-        self._debug_out('port_caps:\n  port: {}\n  caps: {}\n'.format(
-            port, caps))
+        if not self._enable_output:
+            return
+        logger.debug('port_caps:\n  port: %s\n  caps: %s\n', port, caps)
 
     def callsign_heard_on_port(self, port, heard_call):
-        self._debug_out(
-            'callsign_heard_on_port:\n  port: {}\n  heard: {}\n'.format(
-                port, heard_call))
+        if not self._enable_output:
+            return
+        logger.debug(
+            'callsign_heard_on_port:\n  port: %s\n  heard: %s\n',
+            port, heard_call)
 
     def frames_waiting_on_port(self, port, frames):
-        self._debug_out(
-            'frames_waiting_on_port:\n  port: {}\n  frames: {}\n'.format(
-                port, frames))
+        if not self._enable_output:
+            return
+        logger.debug(
+            'frames_waiting_on_port:\n  port: %s\n  frames: %s\n',
+            port, frames)
 
     def connection_received(self, port, call_from, call_to, incoming, message):
-        self._debug_out(
-            ('connection_received:\n  port: {}\n  call_from: {}\n'
-             '  call_to: {}\n  incoming: {}\n  message: {}\n').format(
-                port, call_from, call_to, incoming, message))
+        if not self._enable_output:
+            return
+        logger.debug(
+            'connection_received:\n  port: %s\n  call_from: %s\n'
+            '  call_to: %s\n  incoming: %s\n  message: %s\n',
+            port, call_from, call_to, incoming, message)
 
     def connected_data(self, port, call_from, call_to, pid, data):
-        self._debug_out(
-            ('connected_data:\n  port: {}\n  call_from: {}\n'
-             '  call_to: {}\n  pid: {}\n  data: {}\n').format(
-                port, call_from, call_to, pid, data))
+        if not self._enable_output:
+            return
+        logger.debug(
+            'connected_data:\n  port: %s\n  call_from: %s\n'
+            '  call_to: %s\n  pid: %s\n  data: %s\n',
+            port, call_from, call_to, pid, data)
 
     def disconnected(self, port, call_from, call_to, message):
-        self._debug_out(
-            ('disconnected:\n  port: {}\n  call_from: {}\n'
-             '  call_to: {}\n  message: {}\n').format(
-                port, call_from, call_to, message))
+        if not self._enable_output:
+            return
+        logger.debug(
+            'disconnected:\n  port: %s\n  call_from: %s\n'
+            '  call_to: %s\n  message: %s\n',
+            port, call_from, call_to, message)
 
     def frames_waiting_on_connection(self, port, call_from, call_to, frames):
-        self._debug_out(
-            ('frames_waiting_on_connection:\n  port: {}\n  call_from: {}\n'
-             '  call_to: {}\n  frames: {}\n').format(
-                port, call_from, call_to, frames))
+        if not self._enable_output:
+            return
+        logger.debug(
+            'frames_waiting_on_connection:\n  port: %s\n  call_from: %s\n'
+            '  call_to: %s\n  frames: %s\n',
+            port, call_from, call_to, frames)
 
     def monitored_connected(self, port, call_from, call_to, text, data):
-        self._debug_out(
-            ('monitored_connected:\n  port: {}\n  call_from: {}\n'
-             '  call_to: {}\n  text: {}\n data: {}\n').format(
-                port, call_from, call_to, text, data))
+        if not self._enable_output:
+            return
+        logger.debug(
+            'monitored_connected:\n  port: %s\n  call_from: %s\n'
+            '  call_to: %s\n  text: %s\n data: %s\n',
+            port, call_from, call_to, text, data)
 
     def monitored_supervisory(self, port, call_from, call_to, text):
-        self._debug_out(
-            ('monitored_supervisory:\n  port: {}\n  call_from: {}\n'
-             '  call_to: {}\n  text: {}\n').format(
-                port, call_from, call_to, text))
+        if not self._enable_output:
+            return
+        logger.debug(
+            'monitored_supervisory:\n  port: %s\n  call_from: %s\n'
+            '  call_to: %s\n  text: %s\n',
+            port, call_from, call_to, text)
 
     def monitored_unproto(self, port, call_from, call_to, text, data):
-        self._debug_out(
-            ('monitored_unproto:\n  port: {}\n  call_from: {}\n'
-             '  call_to: {}\n  text: {}\n data: {}\n').format(
-                port, call_from, call_to, text, data))
+        if not self._enable_output:
+            return
+        logger.debug(
+            'monitored_unproto:\n  port: %s\n  call_from: %s\n'
+            '  call_to: %s\n  text: %s\n data: %s\n',
+            port, call_from, call_to, text, data)
 
     def monitored_own(self, port, call_from, call_to, text, data):
-        self._debug_out(
-            ('monitored_own:\n  port: {}\n  call_from: {}\n'
-             '  call_to: {}\n  text: {}\n  data: {}\n').format(
-                port, call_from, call_to, text, data))
+        if not self._enable_output:
+            return
+        logger.debug(
+            'monitored_own:\n  port: %s\n  call_from: %s\n'
+            '  call_to: %s\n  text: %s\n  data: %s\n',
+            port, call_from, call_to, text, data)
 
     def monitored_raw(self, port, data):
-        self._debug_out('monitored_raw:\n  port: {}\n  data: {}\n'.format(
-            port, data))
+        if not self._enable_output:
+            return
+        logger.debug('monitored_raw:\n  port: %s\n  data: %s\n', port, data)
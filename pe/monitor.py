@@ -36,7 +36,7 @@ class Monitor:
         :param str call_from: Callsign of sending station.
         :param str call_to: Callsign of destination station.
         :param str text: Textual representation of frame, in AGWPE format.
-        :param bytearray data: Data associated with the frame.
+        :param bytes data: Data associated with the frame.
         """
         pass
 
@@ -65,7 +65,7 @@ class Monitor:
         :param str call_from: Callsign of sending station.
         :param str call_to: Callsign of destination station.
         :param str text: Textual representation of frame, in AGWPE format.
-        :param bytearray data: Data associated with the frame.
+        :param bytes data: Data associated with the frame.
         """
         pass
 
@@ -80,7 +80,7 @@ class Monitor:
         :param str call_from: Callsign of sending station.
         :param str call_to: Callsign of destination station.
         :param str text: Textual representation of frame, in AGWPE format.
-        :param bytearray data: Data associated with the frame.
+        :param bytes data: Data associated with the frame.
         """
         pass
 
@@ -92,11 +92,17 @@ class Monitor:
         Corresponding frame type: 'K'
 
         :param int port: Port on which frame was received.
-        :param bytearray data: Raw AX.25 frame data.
+        :param bytes data: Raw AX.25 frame data.
         """
         pass
 
 
+# Stand-in used when no monitor has been set, so that the dispatch
+# methods below need no per-event None check; the base class methods
+# are already no-ops
+_NULL_MONITOR = Monitor()
+
+
 class MonitorReceiveHandler(ReceiveHandler):
     """
     Delegates monitoring events to a :class:`Monitor` instance.
@@ -107,7 +113,7 @@ class MonitorReceiveHandler(ReceiveHandler):
     """
 
     def __init__(self):
-        self._monitor = None
+        self._monitor = _NULL_MONITOR
 
     @property
     def monitor(self):
@@ -116,30 +122,24 @@ class MonitorReceiveHandler(ReceiveHandler):
 
         :type: Monitor
         """
-        return self._monitor
+        return None if self._monitor is _NULL_MONITOR else self._monitor
 
     @monitor.setter
     def monitor(self, mon):
-        self._monitor = mon
+        self._monitor = mon if mon is not None else _NULL_MONITOR
 
     def monitored_connected(self, port, call_from, call_to, text, data):
-        if self._monitor:
-            self._monitor.monitored_connected(
-                port, call_from, call_to, text, data)
+        self._monitor.monitored_connected(
+            port, call_from, call_to, text, data)
 
     def monitored_supervisory(self, port, call_from, call_to, text):
-        if self._monitor:
-            self._monitor.monitored_supervisory(port, call_from, call_to, text)
+        self._monitor.monitored_supervisory(port, call_from, call_to, text)
 
     def monitored_unproto(self, port, call_from, call_to, text, data):
-        if self._monitor:
-            self._monitor.monitored_unproto(
-                port, call_from, call_to, text, data)
+        self._monitor.monitored_unproto(port, call_from, call_to, text, data)
 
     def monitored_own(self, port, call_from, call_to, text, data):
-        if self._monitor:
-            self._monitor.monitored_own(port, call_from, call_to, text, data)
+        self._monitor.monitored_own(port, call_from, call_to, text, data)
 
     def monitored_raw(self, port, data):
-        if self._monitor:
-            self._monitor.monitored_raw(port, data)
+        self._monitor.monitored_raw(port, data)
@@ -82,16 +82,20 @@ class _Signal:
     .. document private functions
     .. automethod:: listen
     """
+    __slots__ = ('name', 'receivers')
+
     def __init__(self, name):
         self.name = name
-        self.receivers = []
+        self.receivers = ()
 
     def listen(self, fn):
         """
         Invoke the specified function whenever this signal is emitted.
         :param function fn: A function of the form ``callback(name, data)``.
         """
-        self.receivers.append(fn)
+        # Rebind rather than mutate, so an emit that is underway keeps
+        # iterating its own snapshot even if a callback adds a listener
+        self.receivers = self.receivers + (fn,)
 
     def emit(self, data=None):
         """
@@ -107,6 +111,8 @@ class _Signals:
 
     Do not instantiate this class; use the `signal` singleton instead.
     """
+    __slots__ = ('signals',)
+
     def __init__(self):
         self.signals = {}
 
@@ -119,10 +125,10 @@ class _Signals:
 
         :returns: The new signal instance.
         """
-        if name in self.signals:
-            return self.signals[name]
-        signal = _Signal(name)
-        self.signals[name] = signal
+        signal = self.signals.get(name)
+        if signal is None:
+            signal = _Signal(name)
+            self.signals[name] = signal
         return signal
 
 